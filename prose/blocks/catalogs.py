@@ -2,7 +2,6 @@ import warnings
 
 import astropy.units as u
 import numpy as np
-import pandas as pd
 import twirl
 from astropy.coordinates import SkyCoord
 from astropy.time import Time
@@ -103,19 +102,12 @@ class _CatalogBlock(Block):
                 else:
                     matches[i] = None
 
-            new_df_dict = []
-            nans = {name: np.nan for name in image.catalogs[self.catalog_name].keys()}
-
-            for i in range(len(coords_1)):
-                if matches[i] is not None:
-                    new_df_dict.append(
-                        dict(image.catalogs[self.catalog_name].iloc[int(matches[i])])
-                    )
-                    pass
-                else:
-                    new_df_dict.append(nans)
-
-            catalog = pd.DataFrame(new_df_dict)
+            # catalog has a RangeIndex, so unmatched sources (label -1) become NaN rows
+            matched = [
+                -1 if matches[i] is None else int(matches[i])
+                for i in range(len(coords_1))
+            ]
+            catalog = catalog.reindex(matched).reset_index(drop=True)
 
         image.catalogs[self.catalog_name] = catalog.iloc[0 : self.limit]
 
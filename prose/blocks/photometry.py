@@ -95,6 +95,7 @@ class AnnulusBackground(_AnnulusPhotometry):
         """
         super().__init__(name=name, rin=rin, rout=rout, scale=scale)
         self.sigma = sigma
+        self._chunk_size = 256
 
     def run(self, image: Image):
         if self.scale:
@@ -109,17 +110,35 @@ class AnnulusBackground(_AnnulusPhotometry):
         annulus_masks = annulus.to_mask(method="center")
         annulus_area = np.pi * (rout**2 - rin**2)
 
-        bkg_median = []
+        annuli_data = []
         for mask in annulus_masks:
             annulus_data = mask.multiply(image.data)
             if annulus_data is not None:
-                annulus_data_1d = annulus_data[mask.data > 0]
-                _, median_sigma_clip, _ = sigma_clipped_stats(
-                    annulus_data_1d, sigma=self.sigma
-                )
-                bkg_median.append(median_sigma_clip)
+                annuli_data.append(annulus_data[mask.data > 0])
             else:
-                bkg_median.append(0.0)
+                # yields a 0.0 background
+                annuli_data.append(np.zeros(1))
+
+        # annuli pixels are padded into (sources, pixels) arrays, so that annuli are
+        # sigma clipped by chunks of sources rather than one call per source, the chunk
+        # size bounding memory for images with many sources
+        bkg_median = np.zeros(len(annuli_data))
+        for start in range(0, len(annuli_data), self._chunk_size):
+            chunk = annuli_data[start : start + self._chunk_size]
+            n_pixels = max(len(data) for data in chunk)
+            if n_pixels == 0:
+                bkg_median[start : start + len(chunk)] = np.nan
+                continue
+            # padding is masked rather than NaN, so that only actual invalid pixels warn
+            annuli = np.zeros((len(chunk), n_pixels))
+            padding = np.ones((len(chunk), n_pixels), dtype=bool)
+            for i, data in enumerate(chunk):
+                annuli[i, : len(data)] = data
+                padding[i, : len(data)] = False
+            _, median, _ = sigma_clipped_stats(
+                annuli, mask=padding, sigma=self.sigma, axis=1
+            )
+            bkg_median[start : start + len(chunk)] = median
 
         image.computed["annulus"] = {
             "rin": rin,
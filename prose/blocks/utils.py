@@ -1,3 +1,5 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from pathlib import Path
 from typing import Union
@@ -344,8 +346,9 @@ class Calibration(Block):
         data = image.data
         exposure = image.exposure.value if image.exposure is not None else 1.0
         calibrated_image = self.calibration(data, exposure)
-        calibrated_image[calibrated_image < 0] = np.nan
-        calibrated_image[~np.isfinite(calibrated_image)] = -1
+        # negative, NaN and infinite pixels are set to -1 in a single masked write
+        valid = (calibrated_image >= 0) & (calibrated_image < np.inf)
+        np.copyto(calibrated_image, -1, where=~valid)
         image.data = calibrated_image
 
     def _share(self):
@@ -386,13 +389,14 @@ class CleanBadPixels(Block):
         if darks is not None:
             info("buidling bad pixels map")
             if darks is not None:
-                max_dark = self.loader(darks[0]).data
-                min_dark = self.loader(darks[0]).data
+                # float64 buffers updated in place, avoiding a (2, H, W) temporary per dark
+                max_dark = np.array(self.loader(darks[0]).data, dtype=np.float64)
+                min_dark = max_dark.copy()
 
-                for im in darks:
+                for im in darks[1:]:
                     data = self.loader(im).data
-                    max_dark = np.max([max_dark, data], axis=0)
-                    min_dark = np.min([min_dark, data], axis=0)
+                    np.maximum(max_dark, data, out=max_dark)
+                    np.minimum(min_dark, data, out=min_dark)
 
                 master_max_dark = self.loader(data=max_dark).data
                 master_min_dark = self.loader(data=min_dark).data
@@ -571,7 +575,11 @@ class GetFluxes(Get):
             raise ValueError(
                 "block has empty fluxes (check if stars are present in image or if image has been discarded)"
             )
-        raw_fluxes = (self._fluxes - self._bkg[:, :, None] * area[:, None, :]).T
+        # (time, star, aperture) -> C-contiguous (aperture, star, time) in a single
+        # pass, so that Fluxes reductions along time read contiguous memory
+        raw_fluxes = np.subtract(
+            self._fluxes.T, (self._bkg[:, :, None] * area[:, None, :]).T, order="C"
+        )
         time = self._time
         data = {"bkg": np.mean(self._bkg, -1)}
         data.update({key: value for key, value in self.values.items() if key[0] != "_"})
@@ -580,16 +588,27 @@ class GetFluxes(Get):
             fluxes=raw_fluxes,
             data=data,
             apertures=self._apertures,
-            errors=self._errors.T,
+            errors=np.ascontiguousarray(self._errors.T),
         )
 
 
 class WriteTo(Block):
     def __init__(
-        self, destination, label="processed", imtype=True, overwrite=False, name=None
+        self,
+        destination,
+        label="processed",
+        imtype=True,
+        overwrite=False,
+        workers=0,
+        name=None,
     ):
         """Write image to FITS file
 
+        If ``workers > 0``, files are written by a pool of background threads so that the
+        sequence does not wait on disk IO, pending writes being completed when the block
+        terminates. This requires the block to be run within a :py:class:`~prose.Sequence`
+        (not a :py:class:`~prose.SequenceParallel`) so that :code:`terminate` is called.
+
         Parameters
         ----------
         destination : str
@@ -600,6 +619,9 @@ class WriteTo(Block):
             If bool, whether to set image imtype as label (`image.header["IMTYPE"] = label`). If a `str`, label to set for imtype (`image.header["IMTYPE"] = imtype`) , by default True
         overwrite : bool, optional
             whether to overwrite existing file, by default False
+        workers : int, optional
+            number of threads writing files in the background, by default 0 (files are
+            written synchronously)
         name : str, optional
             name of the block, by default None
         """
@@ -616,14 +638,28 @@ class WriteTo(Block):
             assert isinstance(imtype, str), "imtype must be a bool or a str"
             self.imtype = imtype
 
+        assert workers >= 0, "workers must be positive or 0"
+        self.workers = workers
         self.files = []
+        self._pool = None
+        self._pending = deque()
+
+    def _write(self, hdu, path):
+        # silentfix restores mandatory cards missing from headers not read from FITS
+        try:
+            hdu.writeto(
+                path,
+                overwrite=self.overwrite,
+                output_verify="silentfix",
+                checksum=False,
+            )
+        except Exception as ex:
+            # background writes are reported later, so the failing file is named
+            raise OSError(f"could not write {path}: {ex}") from ex
 
     def run(self, image):
         self.destination.mkdir(exist_ok=True, parents=True)
 
-        new_hdu = fits.PrimaryHDU(image.data)
-        new_hdu.header = image.header
-
         if self.imtype is not None:
             image.header[image.telescope.keyword_image_type] = self.imtype
 
@@ -631,9 +667,48 @@ class WriteTo(Block):
             Path(image.metadata["path"]).stem + f"_{self.label}.fits"
         )
 
-        new_hdu.writeto(fits_new_path, overwrite=self.overwrite)
+        if self.workers == 0:
+            new_hdu = fits.PrimaryHDU(image.data)
+            new_hdu.header = image.header
+            self._write(new_hdu, fits_new_path)
+            self.files.append(fits_new_path)
+            return
+
+        # data and header are copied as following blocks may modify them while written
+        new_hdu = fits.PrimaryHDU(image.data.copy())
+        new_hdu.header = image.header.copy()
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+
+        self._pending.append(self._pool.submit(self._write, new_hdu, fits_new_path))
+        # bound the number of images held in memory while waiting to be written
+        self._wait(2 * self.workers)
+
         self.files.append(fits_new_path)
 
+    def _wait(self, n_pending):
+        # wait until at most n_pending writes are left, shutting the pool down if any fails
+        try:
+            while len(self._pending) > n_pending:
+                self._pending.popleft().result()
+        except BaseException:
+            self._shutdown()
+            raise
+
+    def _shutdown(self):
+        # cancel_futures is not available in python 3.8
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def terminate(self):
+        self._wait(0)
+        self._shutdown()
+
 
 class SelectiveStack(Block):
     def __init__(self, n=5, name=None):
@@ -650,19 +725,23 @@ class SelectiveStack(Block):
         """
         super().__init__(name=name)
         self.n = n
-        self._images = []
+        self._data = None
         self._sigmas = []
 
     def run(self, image: Image):
         sigma = image.fwhm
-        if len(self._images) < self.n:
-            self._images.append(image)
+        if self._data is None:
+            # only the data of the n best images is retained, not the Image objects,
+            # in float64 so that no frame is cast down whatever its dtype
+            self._data = np.empty((self.n, *image.data.shape), dtype=np.float64)
+        if len(self._sigmas) < self.n:
+            self._data[len(self._sigmas)] = image.data
             self._sigmas.append(sigma)
         else:
             i = np.argmax(self._sigmas)
             if self._sigmas[i] > sigma:
                 self._sigmas[i] = sigma
-                self._images[i] = image
+                self._data[i] = image.data
 
     def terminate(self):
-        self.stack = Image(easy_median([im.data for im in self._images]))
+        self.stack = Image(easy_median(self._data[: len(self._sigmas)]))
@@ -11,9 +11,9 @@ __all__ = ["VideoPlot", "Video"]
 
 
 def im_to_255(image):
-    data = image.copy().astype(float)
-    data = data / np.max(data)
-    data = data * 255
+    # normalized into a single new float array, then scaled in place
+    data = np.divide(image, np.max(image), dtype=float)
+    data *= 255
     return data.astype("uint8")
 
 
@@ -70,9 +70,8 @@ class Video(Block):
         if data_function is None:
 
             def data_function(data):
-                new_data = data.copy()
-                new_data = z_scale(new_data, c=contrast)
-                return new_data
+                # z_scale does not modify data in place, no need to copy it
+                return z_scale(data, c=contrast)
 
         output = []
         if compression is not None:
@@ -153,10 +152,17 @@ class VideoPlot(Video):
 
     def run(self, image):
         self.plot_function(image)
+        # raw RGBA output avoids encoding and decoding a PNG per frame
+        figure = plt.gcf()
+        dpi = plt.rcParams["savefig.dpi"]
+        if dpi == "figure":
+            dpi = figure.dpi
+        width, height = (figure.get_size_inches() * dpi).astype(int)
         buf = io.BytesIO()
-        plt.savefig(buf)
-        self.writer.append_data(imageio.imread(buf))
-        plt.close()
+        figure.savefig(buf, format="rgba", dpi=dpi, bbox_inches=None)
+        frame = np.frombuffer(buf.getvalue(), dtype=np.uint8).reshape(height, width, 4)
+        self.writer.append_data(frame)
+        plt.close(figure)
 
     def terminate(self):
         plt.close()
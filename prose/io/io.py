@@ -198,18 +198,17 @@ def fits_to_df(
     )
 
     if len(df) > 0 and _telescope is not None:
-        df.type.loc[
-            df.type.str.lower().str.contains(_telescope.keyword_light_images.lower())
-        ] = "light"
-        df.type.loc[
-            df.type.str.lower().str.contains(_telescope.keyword_dark_images.lower())
-        ] = "dark"
-        df.type.loc[
-            df.type.str.lower().str.contains(_telescope.keyword_bias_images.lower())
-        ] = "bias"
-        df.type.loc[
-            df.type.str.lower().str.contains(_telescope.keyword_flat_images.lower())
-        ] = "flat"
+        # lower-cased once, later keywords taking precedence as labels are assigned in order
+        types = df.type.str.lower()
+        for label, keyword in (
+            ("light", _telescope.keyword_light_images),
+            ("dark", _telescope.keyword_dark_images),
+            ("bias", _telescope.keyword_bias_images),
+            ("flat", _telescope.keyword_flat_images),
+        ):
+            mask = types.str.contains(keyword.lower())
+            types[mask] = label
+            df.loc[mask, "type"] = label
         df.telescope.loc[df.telescope.str.lower().str.contains("unknown")] = ""
         df.date = pd.to_datetime(df.date)
         df["filter"] = df["filter"].str.replace("'", "p")
@@ -219,9 +218,7 @@ def fits_to_df(
 
         # We want dates that correspond to same observations but night might be over 2 days (before and after midnight)
         # So we remove 15 hours to be sure the date year-month-day are consistent with single observations
-        df.date = (df.date - timedelta(hours=15)).apply(
-            lambda x: x.strftime("%Y-%m-%d")
-        )
+        df.date = (df.date - timedelta(hours=15)).dt.strftime("%Y-%m-%d")
 
     return df
 
@@ -108,7 +108,7 @@ def index_binning(x, size):
 
 def z_scale(data, c=0.05):
     interval = ZScaleInterval(contrast=c)
-    return interval(data.copy())
+    return interval(data)
 
 
 def rescale(y):
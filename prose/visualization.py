@@ -6,6 +6,7 @@ import numpy as np
 from astropy.io import fits
 from matplotlib import patches
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+from matplotlib.collections import PatchCollection
 from matplotlib.legend_handler import HandlerPatch
 from matplotlib.lines import Line2D
 from matplotlib.ticker import AutoMinorLocator
@@ -437,13 +438,16 @@ def plot_marks(
     if label is None:
         label = [None for _ in range(len(x))]
 
+    # a single collection is much cheaper to build and draw than one artist per mark
+    circles = [mpatches.Circle((_x, _y), ms) for _x, _y in zip(x, y)]
+    ax.add_collection(
+        PatchCollection(circles, facecolor="none", edgecolor=color, alpha=alpha),
+        autolim=False,
+    )
+
     for _x, _y, _label in zip(x, y, label):
-        circle = mpatches.Circle((_x, _y), ms, fill=None, ec=color, alpha=alpha)
-        ax = plt.gca()
-        ax.add_artist(circle)
-        f = 5
         if _label is not None:
-            plt.annotate(
+            ax.annotate(
                 _label,
                 xy=[_x, _y - y_offset],
                 color=color,
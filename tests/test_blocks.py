@@ -265,3 +265,79 @@ def test_VideoPlot(tmp_path):
     im = image.copy()
 
     Sequence([VideoPlot(plot, tmp_path / "video.gif", fps=3)]).run([im, im, im])
+
+
+def test_CleanBadPixels_from_darks():
+    from prose.blocks import CleanBadPixels
+
+    darks = [np.ones((20, 20), dtype=np.uint16) for _ in range(3)]
+    darks[1][5, 5] = 1000
+    darks[2][8, 3] = 0
+
+    block = CleanBadPixels(darks=darks)
+    assert block.bad_pixels_map[5, 5] == 1
+    assert block.bad_pixels_map[8, 3] == 1
+    assert block.bad_pixels_map.sum() == 2
+
+
+def test_Calibration_invalid_pixels():
+    from prose.blocks import Calibration
+
+    im = image.copy()
+    im.data = np.ones((4, 4))
+    im.data[0, 0] = -3.0
+    im.data[1, 1] = np.nan
+    im.data[2, 2] = np.inf
+    Calibration().run(im)
+
+    expected = np.ones((4, 4))
+    expected[[0, 1, 2], [0, 1, 2]] = -1
+    np.testing.assert_array_equal(im.data, expected)
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_WriteTo(tmp_path, workers):
+    from astropy.io import fits
+
+    from prose.blocks import WriteTo
+
+    images = []
+    for i in range(3):
+        im = image.copy()
+        im.metadata["path"] = f"image_{i}.fits"
+        images.append(im)
+
+    block = WriteTo(tmp_path, imtype=False, workers=workers)
+    Sequence([block]).run(images, show_progress=False)
+
+    assert len(block.files) == 3
+    for path, im in zip(block.files, images):
+        np.testing.assert_array_equal(fits.getdata(path), im.data)
+
+
+def test_WriteTo_failed_write(tmp_path):
+    from prose.blocks import WriteTo
+
+    im = image.copy()
+    im.metadata["path"] = "image.fits"
+    Sequence([WriteTo(tmp_path, imtype=False)]).run([im], show_progress=False)
+
+    # file exists and overwrite is False
+    block = WriteTo(tmp_path, imtype=False, workers=2)
+    with pytest.raises(OSError, match="image_processed.fits"):
+        Sequence([block]).run([im, im], show_progress=False)
+    assert block._pool is None
+    assert len(block._pending) == 0
+
+
+def test_SelectiveStack():
+    images = []
+    for fwhm in [5.0, 1.0, 4.0, 2.0]:
+        im = image.copy()
+        im.data = np.ones((10, 10)) * fwhm
+        im.fwhm = fwhm
+        images.append(im)
+
+    block = blocks.SelectiveStack(n=2)
+    Sequence([block]).run(images, show_progress=False)
+    np.testing.assert_allclose(block.stack.data, 1.5)
@@ -34,8 +34,8 @@ def test_block_tested():
 
     assert is_tested(blocks.PointSourceDetection)
     assert is_tested("PointSourceDetection")
-    assert not is_tested(blocks.WriteTo)
-    assert not is_tested("WriteTo")
+    assert not is_tested(blocks.TESSCatalog)
+    assert not is_tested("TESSCatalog")
 
 
 @pytest.mark.skip(reason="takes too long")
@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 
 from prose import Sequence, blocks, simulations
@@ -37,3 +39,38 @@ def test_AperturePhotometryAnnulusBackground():
     fluxes.aperture = 0
     fluxes.target = 14
     assert np.allclose(true_y, fluxes.flux)
+
+
+def test_AnnulusBackground_medians():
+    from astropy.stats import sigma_clipped_stats
+    from astropy.utils.exceptions import AstropyUserWarning
+
+    from prose.core.source import PointSource, Sources
+
+    im = images[0].copy()
+    im.data = im.data + np.random.normal(0, 1, im.data.shape)
+    # last source lies away from the image, so its annulus does not overlap it
+    im.sources = Sources(
+        [PointSource(coords=c) for c in [*_coords[0:5] * shape, (500.0, 500.0)]],
+        type="PointSource",
+    )
+
+    block = blocks.AnnulusBackground(rin=5, rout=8, scale=False)
+    block._chunk_size = 2
+    with warnings.catch_warnings():
+        # padding of annuli with different number of pixels must not warn
+        warnings.simplefilter("error", AstropyUserWarning)
+        block.run(im)
+
+    expected = []
+    for mask in im.sources.annulus(5, 8).to_mask(method="center"):
+        annulus_data = mask.multiply(im.data)
+        if annulus_data is None:
+            expected.append(0.0)
+        else:
+            expected.append(
+                sigma_clipped_stats(annulus_data[mask.data > 0], sigma=3)[1]
+            )
+
+    assert expected[-1] == 0.0
+    np.testing.assert_allclose(im.annulus["median"], expected)